@@ -0,0 +1,92 @@
+"""Background file writer for non-critical build artefacts.
+
+Scripts hand ``(path, bytes)`` chunks to an :class:`AsyncWriter` and carry
+on while a daemon thread performs the disk I/O. Each path is opened once,
+so later chunks for the same path are appended to the same buffered handle
+and large outputs can be streamed piecewise.
+
+Use the writer as a context manager (or call :meth:`AsyncWriter.close`) so
+the queue is drained, every file is closed and any write error is raised
+in the calling thread. Data that must be on disk before the script moves on
+(e.g. ``events.json``) should keep being written synchronously.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple
+
+BUFFER_SIZE = 1 << 20
+
+
+class AsyncWriter:
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Optional[Tuple[str, bytes, bool]]]" = queue.Queue()
+        self._files: Dict[str, BinaryIO] = {}
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="async-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "AsyncWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.close()
+        except Exception:
+            if exc_type is None:
+                raise
+
+    def write(self, path: str, data: bytes, *, append: bool = False) -> None:
+        """Queue ``data`` for ``path``; the first chunk truncates the file unless ``append``."""
+        self._queue.put((path, data, append))
+
+    def writelines(self, path: str, chunks: Iterable[bytes], *, append: bool = False) -> None:
+        """Queue every chunk from ``chunks`` for ``path``, consuming it lazily."""
+        for data in chunks:
+            self.write(path, data, append=append)
+
+    def flush(self) -> None:
+        """Block until every queued chunk has been handed to its file."""
+        self._queue.join()
+        self._raise_pending()
+
+    def close(self) -> None:
+        """Drain the queue, close every file and stop the worker thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_pending()
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise err
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    self._close_files()
+                    return
+                if self._error is None:
+                    path, data, append = item
+                    handle = self._files.get(path)
+                    if handle is None:
+                        handle = open(path, "ab" if append else "wb", buffering=BUFFER_SIZE)
+                        self._files[path] = handle
+                    handle.write(data)
+            except Exception as ex:  # surfaced by flush()/close()
+                self._error = self._error or ex
+            finally:
+                self._queue.task_done()
+
+    def _close_files(self) -> None:
+        for handle in self._files.values():
+            try:
+                handle.close()
+            except Exception as ex:  # pragma: no cover - disk full etc.
+                self._error = self._error or ex
+        self._files.clear()
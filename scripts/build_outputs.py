@@ -1,81 +1,97 @@
 #!/usr/bin/env python3
-import os, json, re, uuid
+import os, json, re, sys, uuid
 from datetime import datetime, timedelta, timezone
+from async_writer import AsyncWriter
+
+try:
+    import orjson  # optional C-accelerated JSON
+except ImportError:
+    orjson = None
 
 HTML_PATH = "index.html"
 ICS_PATH  = "London_Expos.ics"
 EVENTS_JSON = "events.json"
+ALL_EVENTS_RE = re.compile(r'const allEvents = \[.*?\];', re.DOTALL)
 
 def load_events():
-    with open(EVENTS_JSON, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(EVENTS_JSON, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
 
-def parse_iso(dt_str: str) -> datetime:
-    return datetime.fromisoformat(dt_str.replace("Z","+00:00"))
+if sys.version_info >= (3, 11):
+    parse_iso = datetime.fromisoformat  # parses a trailing "Z" natively
+else:
+    def parse_iso(dt_str: str) -> datetime:
+        return datetime.fromisoformat(dt_str.replace("Z","+00:00"))
 
-def within_next_three_months(dt: datetime) -> bool:
-    now = datetime.now(timezone.utc)
-    return now <= dt <= (now + timedelta(days=92))
+ESC_RE = re.compile(r'[\\;,\n]')
+ESC_MAP = {"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"}
 
 def esc(s: str) -> str:
-    s = (s or "")
-    return s.replace("\\","\\\\").replace(";","\\;").replace(",","\\,").replace("\n","\\n")
+    # one C-level scan instead of four full-string replace passes
+    return ESC_RE.sub(lambda m: ESC_MAP[m.group(0)], s or "")
 
 def to_utc_ics(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")  # ends with Z
 
-def write_ics(events):
+def write_ics(events, writer: AsyncWriter):
     dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    lines = [
-        "BEGIN:VCALENDAR","VERSION:2.0","PRODID:-//ExpoApp//London Expos//EN",
-        "CALSCALE:GREGORIAN","METHOD:PUBLISH","X-WR-CALNAME:London Expos (Next 3 Months)"
-    ]
+    # stream one VEVENT at a time; the writer appends each chunk to one buffered handle
+    write = lambda text: writer.write(ICS_PATH, text.encode("utf-8"))
+    write(
+        "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//ExpoApp//London Expos//EN\n"
+        "CALSCALE:GREGORIAN\nMETHOD:PUBLISH\nX-WR-CALNAME:London Expos (Next 3 Months)\n"
+    )
     for e in events:
         s = to_utc_ics(parse_iso(e["start"]))
         en = to_utc_ics(parse_iso(e["end"]))
         desc = f"{e['title']} — {e.get('url','')}"
         if e.get("free") is True: desc += " (Free event)"
-        lines += [
-            "BEGIN:VEVENT",
-            f"UID:{uuid.uuid4()}@expoapp",
-            f"DTSTAMP:{dtstamp}",
-            f"DTSTART:{s}",
-            f"DTEND:{en}",
-            f"SUMMARY:{esc(e['title'])}",
-            f"LOCATION:{esc(e.get('venue',''))}",
-            f"DESCRIPTION:{esc(desc)}",
-            f"URL:{e.get('url','')}",
-            "END:VEVENT"
-        ]
-    lines.append("END:VCALENDAR")
-    with open(ICS_PATH,"w",encoding="utf-8") as f: f.write("\n".join(lines))
+        write(
+            "BEGIN:VEVENT\n"
+            f"UID:{uuid.uuid4()}@expoapp\n"
+            f"DTSTAMP:{dtstamp}\n"
+            f"DTSTART:{s}\n"
+            f"DTEND:{en}\n"
+            f"SUMMARY:{esc(e['title'])}\n"
+            f"LOCATION:{esc(e.get('venue',''))}\n"
+            f"DESCRIPTION:{esc(desc)}\n"
+            f"URL:{e.get('url','')}\n"
+            "END:VEVENT\n"
+        )
+    write("END:VCALENDAR")
 
 def inject_events_into_html(html_text: str, events_window):
-    m = re.search(r'const allEvents = (\[.*?\]);', html_text, flags=re.DOTALL)
+    # one search, then splice: no second scan and no re.sub escape handling of the JSON
+    m = ALL_EVENTS_RE.search(html_text)
     if not m: return html_text
-    new_blob = json.dumps(events_window, ensure_ascii=False)
-    return re.sub(r'const allEvents = \[.*?\];', f'const allEvents = {new_blob};', html_text, flags=re.DOTALL)
+    new_blob = orjson.dumps(events_window).decode("utf-8") if orjson else json.dumps(events_window, ensure_ascii=False)
+    return f"{html_text[:m.start()]}const allEvents = {new_blob};{html_text[m.end():]}"
 
 def main():
     all_events = load_events()
 
     # Keep only NEXT ~3 months for the site/feed
+    now = datetime.now(timezone.utc)
+    horizon = now + timedelta(days=92)
     window = []
     for e in all_events:
         try:
             sdt = parse_iso(e["start"])
         except Exception:
             continue
-        if within_next_three_months(sdt):
+        if now <= sdt <= horizon:
             window.append(e)
 
-    # Write ICS (UTC Z timestamps so Outlook reads it)
-    write_ics(window)
+    # Both artefacts are rebuilt from events.json, so they are written in the background
+    with AsyncWriter() as writer:
+        # Write ICS (UTC Z timestamps so Outlook reads it)
+        write_ics(window, writer)
 
-    # Inject into index.html (so the site shows the same window)
-    with open(HTML_PATH,"r",encoding="utf-8") as f: html=f.read()
-    new_html = inject_events_into_html(html, window)
-    with open(HTML_PATH,"w",encoding="utf-8") as f: f.write(new_html)
+        # Inject into index.html (so the site shows the same window)
+        with open(HTML_PATH,"r",encoding="utf-8") as f: html=f.read()
+        new_html = inject_events_into_html(html, window)
+        writer.write(HTML_PATH, new_html.encode("utf-8"))
 
     print(f"Built {len(window)} events for next 3 months")
 
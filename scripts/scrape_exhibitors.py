@@ -3,6 +3,11 @@ import json, yaml, re, os, sys, time
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
+try:
+    import orjson  # optional C-accelerated JSON
+except ImportError:
+    orjson = None
+
 TARGETS_YAML = "data/exhibitors_targets.yaml"
 OUT_DIR = Path("data/exhibitors")
 OUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -18,11 +23,15 @@ def save_list(match_title: str, names: list[str]):
         if n.lower() not in seen:
             seen.add(n.lower()); cleaned.append(n)
     out = OUT_DIR / f"{slug(match_title)}.json"
-    with out.open("w", encoding="utf-8") as f:
-        json.dump({"match": match_title, "exhibitors": cleaned}, f, ensure_ascii=False, indent=2)
+    payload = {"match": match_title, "exhibitors": cleaned}
+    if orjson:
+        out.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with out.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
     print(f"[ok] {match_title}: saved {len(cleaned)} exhibitors -> {out}")
 
-def fetch_page(target: dict) -> list[str]:
+def fetch_page(context, target: dict) -> list[str]:
     url = target["url"]
     selector = target.get("selector")
     wait_for = target.get("wait_for", selector)
@@ -30,10 +39,8 @@ def fetch_page(target: dict) -> list[str]:
     click_sel = paginate.get("click")
     max_clicks = int(paginate.get("max_clicks", 0))
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(user_agent="Mozilla/5.0 (London-Expos-Bot)")
-        page = context.new_page()
+    page = context.new_page()
+    try:
         page.goto(url, wait_until="domcontentloaded", timeout=60000)
         if wait_for:
             page.wait_for_selector(wait_for, timeout=60000)
@@ -48,12 +55,12 @@ def fetch_page(target: dict) -> list[str]:
             except Exception:
                 break
 
-        names=[]
-        for el in page.locator(selector).all():
-            txt = (el.text_content() or "").strip()
-            if txt: names.append(txt)
-        browser.close()
-        return names
+        # read every match in one in-page call instead of a round-trip per element
+        return page.locator(selector).evaluate_all(
+            "els => els.map(e => (e.textContent || '').trim()).filter(Boolean)"
+        )
+    finally:
+        page.close()
 
 def main():
     if not os.path.exists(TARGETS_YAML):
@@ -61,12 +68,21 @@ def main():
         return
     with open(TARGETS_YAML, "r", encoding="utf-8") as f:
         targets = yaml.safe_load(f) or []
-    for t in targets:
+    if not targets:
+        return
+    # one browser for every target: Chromium start-up is paid once, not per page
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
         try:
-            names = fetch_page(t)
-            save_list(t["match"], names)
-        except Exception as ex:
-            print(f"[warn] {t.get('match')} failed: {ex}", file=sys.stderr)
+            context = browser.new_context(user_agent="Mozilla/5.0 (London-Expos-Bot)")
+            for t in targets:
+                try:
+                    names = fetch_page(context, t)
+                    save_list(t["match"], names)
+                except Exception as ex:
+                    print(f"[warn] {t.get('match')} failed: {ex}", file=sys.stderr)
+        finally:
+            browser.close()
 
 if __name__ == "__main__":
     main()
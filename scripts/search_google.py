@@ -13,24 +13,50 @@ while we wait for them to appear in search results.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
-from urllib.parse import urlencode, urljoin
+from html import unescape
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlencode, urljoin, urlparse
 
 try:  # pragma: no cover - optional dependency in CI
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
 except ImportError:  # pragma: no cover
     requests = None
 
+import urllib.error
 import urllib.request
 
+try:  # pragma: no cover - optional dependency in CI
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # pragma: no cover - optional dependency in CI
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
 import yaml
+from async_writer import AsyncWriter
 from bs4 import BeautifulSoup
 
+try:  # pragma: no cover - optional dependency in CI
+    import lxml  # type: ignore  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover
+    HTML_PARSER = "html.parser"
+
 try:  # pragma: no cover - Python < 3.9 support
     from zoneinfo import ZoneInfo
 except ImportError:  # pragma: no cover
@@ -42,11 +68,24 @@ CX = os.environ.get("GOOGLE_CX")
 EVENTS_JSON = "events.json"
 CHANGELOG = "CHANGELOG.md"
 WINDOW_DAYS = 84  # 12 weeks ≈ 3 months
+HORIZON_DAYS = 190  # events.json keeps events starting up to this far ahead
+# cached page extractions are trusted this long, so extraction keeps events
+# up to WINDOW_DAYS + CACHE_MAX_AGE_DAYS ahead for a replay to still cover the window
+CACHE_MAX_AGE_DAYS = 28
 HEADERS = {"User-Agent": "Mozilla/5.0 (London-Expos-Updater)"}
-LONDON_TZ = ZoneInfo("Europe/London") if ZoneInfo is not None else timezone.utc
+# (connect, read) seconds for discovered pages and ICS feeds, and the most of
+# a body that is read; a slow or huge page cannot hold a fetch worker for long
+PAGE_TIMEOUT = (5, 15)
+MAX_PAGE_BYTES = 2_000_000
+UTC = timezone.utc
+LONDON_TZ = ZoneInfo("Europe/London") if ZoneInfo is not None else UTC
 
 SECTORS_FILE = os.path.join("data", "industry_sectors.yaml")
 MANUAL_FILE = os.path.join("data", "manual_events.yaml")
+HTTP_CACHE = os.path.join("data", "http_cache.json")
+# pages that yielded no events are not fetched again for this long
+NEGATIVE_URLS = os.path.join("data", "negative_urls.json")
+NEGATIVE_TTL_DAYS = 14
 
 DEFAULT_SECTORS = [
     {
@@ -123,81 +162,305 @@ def load_sector_definitions() -> List[Dict[str, object]]:
 SECTOR_DEFS = load_sector_definitions()
 for sector in SECTOR_DEFS:
     sector["keywords"] = [k.lower() for k in (sector.get("keywords") or [])]
+# one alternation per sector so matching a title is a single regex scan each
+SECTOR_PATTERNS = tuple(
+    (s["name"], re.compile("|".join(re.escape(k) for k in s["keywords"])))
+    for s in SECTOR_DEFS
+    if s["keywords"]
+)
+
+
+def build_sector_automaton():
+    """Return one Aho–Corasick automaton mapping every keyword to its sector's index."""
+    if ahocorasick is None:  # pragma: no cover - runtime dependent
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, sector in enumerate(SECTOR_DEFS):
+        for keyword in sector["keywords"]:
+            if keyword not in automaton:  # a shared keyword belongs to the first sector
+                automaton.add_word(keyword, idx)
+    if not len(automaton):
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+SECTOR_AUTOMATON = build_sector_automaton()
 SECTOR_QUERIES = [s["search"] for s in SECTOR_DEFS if s.get("search")]
 if not SECTOR_QUERIES:
     SECTOR_QUERIES = [s["search"] for s in DEFAULT_SECTORS]
 BASE_QUERY = '(expo OR "trade show" OR exhibition OR fair OR conference) "London"'
+VENUE_QUERIES = (
+    '"ExCeL London"',
+    '"Olympia London"',
+    '"Business Design Centre"',
+    '"QEII Centre"',
+    '"Tobacco Dock"',
+    '"Design Centre Chelsea Harbour"',
+    '"The O2"',
+    "site:excel.london",
+    "site:olympia.london",
+)
+# built once; sectors sharing a search term would otherwise spend quota twice
+ALL_QUERIES = tuple(dict.fromkeys(f"{BASE_QUERY} {q}" for q in [*SECTOR_QUERIES, *VENUE_QUERIES]))
 RESULTS_PER_QUERY = 10
+SEARCH_WORKERS = 10
+SEARCH_QPS = 10  # Custom Search per-second quota
+# no burst on top of the refill rate, so no one-second window exceeds SEARCH_QPS
+SEARCH_BURST = 1
+FETCH_WORKERS = 16
+FETCHES_PER_HOST = 2
+
+
+# ---- JSON helpers -------------------------------------------------------
+
+def jloads(data: str | bytes):
+    if orjson is not None:  # pragma: no branch - runtime dependent
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def jdumps(obj, *, indent: bool = False, sort_keys: bool = False, as_bytes: bool = False) -> str | bytes:
+    if orjson is not None:  # pragma: no branch - runtime dependent
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        data = orjson.dumps(obj, option=option)
+        return data if as_bytes else data.decode("utf-8")
+    text = json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, sort_keys=sort_keys)
+    return text.encode("utf-8") if as_bytes else text
 
 
 def load_events() -> List[Dict[str, object]]:
     try:
-        with open(EVENTS_JSON, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(EVENTS_JSON, "rb") as f:
+            return jloads(f.read())
     except FileNotFoundError:
         return []
 
 
+def persistable(event: Dict[str, object]) -> Dict[str, object]:
+    # underscore-prefixed fields are run-time caches and never persisted
+    return {k: v for k, v in event.items() if not k.startswith("_")}
+
+
 def save_events(events: Sequence[Dict[str, object]]) -> None:
-    with open(EVENTS_JSON, "w", encoding="utf-8") as f:
-        json.dump(list(events), f, ensure_ascii=False, indent=2)
+    with open(EVENTS_JSON, "wb") as f:
+        f.write(jdumps([persistable(e) for e in events], indent=True, as_bytes=True))
+
+
+def load_cache(path: str) -> Dict[str, object]:
+    """Return the ``url -> entry`` map a previous run left in ``path``.
+
+    :data:`HTTP_CACHE` maps to ``{etag, last_modified, sha256, events}`` and
+    :data:`NEGATIVE_URLS` to the ISO expiry of each known non-event page.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = jloads(f.read())
+    except FileNotFoundError:
+        return {}
+    except Exception as ex:  # pragma: no cover - corrupt cache is just a cold start
+        print(f"[warn] Failed to read {path}: {ex}")
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
-def write_changelog(added: Sequence[Dict[str, object]], changed: Sequence[Dict[str, object]]) -> None:
+def write_changelog(writer: AsyncWriter, added: Sequence[Dict[str, object]],
+                    changed: Sequence[Dict[str, object]], now: datetime) -> None:
     if not added and not changed:
         return
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    lines = [
-        f"## {ts} Weekly Google search",
-        f"- NEW: {len(added)}",
-        f"- DATE CHANGED: {len(changed)}",
-        "",
-    ]
-    for e in added:
-        lines.append(
-            f"  - NEW • {e['title']} — {e['venue']} — {e['start'][:10]} → {e['end'][:10]} • {e['url']}"
-        )
-    for e in changed:
-        lines.append(
-            f"  - DATE CHANGED • {e['title']} — {e['venue']} — {e['start'][:10]} → {e['end'][:10]} • {e['url']}"
-        )
-    with open(CHANGELOG, "a", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+
+    def lines() -> Iterable[str]:
+        yield f"## {now:%Y-%m-%d} Weekly Google search\n- NEW: {len(added)}\n- DATE CHANGED: {len(changed)}\n\n"
+        for label, events in (("NEW", added), ("DATE CHANGED", changed)):
+            for e in events:
+                yield f"  - {label} • {e['title']} — {e['venue']} — {e['start'][:10]} → {e['end'][:10]} • {e['url']}\n"
+
+    # one chunk per entry; no intermediate list or join of the whole section
+    writer.writelines(CHANGELOG, (line.encode("utf-8") for line in lines()), append=True)
 
 
 # ---- HTTP helpers -------------------------------------------------------
 
-def http_get(url: str, *, params: Optional[Dict[str, object]] = None, headers=None, timeout: int = 30,
-             as_bytes: bool = False) -> str | bytes:
-    headers = headers or {}
-    if requests is not None:  # pragma: no branch - runtime dependent
-        resp = requests.get(url, params=params, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        return resp.content if as_bytes else resp.text
+NOT_MODIFIED = object()  # http_get result when a cached validator still holds
+CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+def build_session():
+    """Return a pooled keep-alive session with light retries, or ``None`` without requests."""
+    if requests is None:  # pragma: no cover - runtime dependent
+        return None
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+
+def http_get(url: str, *, params: Optional[Dict[str, object]] = None, headers=None,
+             timeout: Union[float, Tuple[float, float]] = 30, as_bytes: bool = False,
+             cache: Optional[Dict[str, Dict[str, object]]] = None, max_bytes: Optional[int] = None,
+             with_charset: bool = False):
+    """GET ``url`` as text (or bytes).
+
+    With ``as_bytes`` and ``with_charset`` a ``(body, charset)`` pair is
+    returned, ``charset`` being the one declared by ``Content-Type`` or ``None``.
+
+    With ``cache``, the stored ETag/Last-Modified for ``url`` are sent as
+    conditional headers and :data:`NOT_MODIFIED` is returned on HTTP 304, or
+    on a 200 whose body hashes the same as the one the cached events came from.
+    Fresh validators from a 200 response replace the cache entry.
+
+    With ``max_bytes`` the body is streamed and anything past that size is
+    never downloaded.
+    """
+    headers = dict(headers or {})
+    entry = cache.get(url) if cache is not None else None
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    if SESSION is not None:  # pragma: no branch - runtime dependent
+        with SESSION.get(url, params=params, headers=headers, timeout=timeout, stream=bool(max_bytes)) as resp:
+            if entry and resp.status_code == 304:
+                return NOT_MODIFIED
+            resp.raise_for_status()
+            if max_bytes:
+                body = resp.raw.read(max_bytes, decode_content=True)
+                text = None if as_bytes else decode_body(body, declared_charset(resp.headers))
+            else:
+                body = resp.content
+                text = None if as_bytes else resp.text
+            if cache is not None and remember_validators(cache, url, resp.headers, body):
+                return NOT_MODIFIED
+            if as_bytes:
+                return (body, declared_charset(resp.headers)) if with_charset else body
+            return text
 
     # Fallback to urllib when requests isn't available.
     if params:
         query = urlencode({k: v for k, v in params.items() if v is not None})
         sep = "&" if "?" in url else "?"
         url = f"{url}{sep}{query}"
+    if isinstance(timeout, tuple):
+        timeout = max(timeout)  # urllib has a single per-operation timeout
     req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:  # nosec B310 (trusted hosts)
-        data = resp.read()
-    return data if as_bytes else data.decode("utf-8", errors="replace")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:  # nosec B310 (trusted hosts)
+            data = resp.read(max_bytes) if max_bytes else resp.read()
+            charset = declared_charset(resp.headers)
+            if cache is not None and remember_validators(cache, url, resp.headers, data):
+                return NOT_MODIFIED
+    except urllib.error.HTTPError as ex:
+        if entry and ex.code == 304:
+            return NOT_MODIFIED
+        raise
+    if as_bytes:
+        return (data, charset) if with_charset else data
+    return decode_body(data, charset)
+
+
+def declared_charset(headers) -> Optional[str]:
+    """Return the ``charset`` parameter of the Content-Type header, if any."""
+    m = CHARSET_RE.search(headers.get("Content-Type") or "")
+    return m.group(1) if m else None
+
+
+def decode_body(body: bytes, charset: Optional[str]) -> str:
+    """Decode ``body`` with the declared ``charset``, or UTF-8 when there is none."""
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:  # unknown charset label
+        return body.decode("utf-8", errors="replace")
+
+
+def remember_validators(cache: Dict[str, Dict[str, object]], url: str, headers, body: bytes) -> bool:
+    """Record the validators and body digest for ``url``.
+
+    Returns ``True`` when the body matches the one the cached events were
+    extracted from; that entry (events included) is kept, so pages served
+    without ETag/Last-Modified are not parsed again either.
+    """
+    fresh = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "sha256": hashlib.sha256(body).hexdigest(),
+    }
+    entry = cache.get(url)
+    if entry and "events" in entry and entry.get("sha256") == fresh["sha256"]:
+        entry.update(fresh)
+        return True
+    cache[url] = fresh
+    return False
 
 
 def http_get_json(url: str, *, params=None, headers=None, timeout: int = 30) -> Dict[str, object]:
-    payload = http_get(url, params=params, headers=headers, timeout=timeout)
-    if isinstance(payload, bytes):
-        payload = payload.decode("utf-8", errors="replace")
+    # both orjson and json accept UTF-8 bytes, so skip the intermediate str
+    payload = http_get(url, params=params, headers=headers, timeout=timeout, as_bytes=True)
     if not payload:
         return {}
-    return json.loads(payload)
+    return jloads(payload)
+
+
+class TokenBucket:
+    """Thread-safe limiter allowing ``rate`` calls per second with bursts of ``burst``."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                time.sleep(wait)
+                # restart from the actual wake-up time; oversleeping must not bank credit
+                self.updated = time.monotonic()
+                self.tokens = 1.0
+            self.tokens -= 1
+
+
+SEARCH_BUCKET = TokenBucket(SEARCH_QPS, SEARCH_BURST)
+
+
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_lock = threading.Lock()
+
+
+def host_slot(url: str) -> threading.BoundedSemaphore:
+    """Return the semaphore limiting concurrent fetches against ``url``'s host."""
+    host = urlparse(url).netloc.lower()
+    with _host_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(FETCHES_PER_HOST)
+    return slot
+
+
+def fetch_page(url: str, cache: Optional[Dict[str, Dict[str, object]]] = None):
+    """Return the raw ``(body, charset)``, ``None`` on failure or :data:`NOT_MODIFIED`."""
+    with host_slot(url):
+        try:
+            return http_get(url, headers=HEADERS, timeout=PAGE_TIMEOUT, as_bytes=True, cache=cache,
+                            max_bytes=MAX_PAGE_BYTES, with_charset=True)
+        except Exception:
+            return None
 
 
 def google_search(q: str, num: int = 10) -> List[str]:
     url = "https://www.googleapis.com/customsearch/v1"
-    params = {"key": API_KEY, "cx": CX, "q": q, "num": num, "safe": "off"}
+    # partial response: only the result links are read, so skip snippets, pagemaps etc.
+    params = {"key": API_KEY, "cx": CX, "q": q, "num": num, "safe": "off", "fields": "items(link)"}
     data = http_get_json(url, params=params, timeout=30)
     items = data.get("items", []) if isinstance(data, dict) else []
     links: List[str] = []
@@ -209,47 +472,93 @@ def google_search(q: str, num: int = 10) -> List[str]:
 
 # ---- parsing helpers ----------------------------------------------------
 
-DATE_RANGE = re.compile(r"(\d{1,2})\s*(?:–|-|to)\s*(\d{1,2})\s+([A-Za-z]{3,})\s+(\d{4})")
-DATE_SINGLE = re.compile(r"(\d{1,2})\s+([A-Za-z]{3,})\s+(\d{4})")
-ISO = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+# ISO dates, "12-14 March 2026" ranges and "12 March 2026" singles in one pass.
+# Zero-width so matches may overlap, e.g. the ISO date in "1 May 2026-05-01";
+# dashes are already normalised by DATE_TEXT_TRANS. The leading (?=\d) lets the
+# engine skip non-digit positions before trying the alternation.
+DATE_ANY = re.compile(
+    r"(?=\d)(?=(?P<iso>(?P<iy>\d{4})-(?P<im>\d{2})-(?P<id>\d{2}))"
+    r"|(?P<range>(?P<rd1>\d{1,2})\s*(?:-|to)\s*(?P<rd2>\d{1,2})\s+(?P<rmon>[A-Za-z]{3,})\s+(?P<ry>\d{4}))"
+    r"|(?P<single>(?P<sd>\d{1,2})\s+(?P<smon>[A-Za-z]{3,})\s+(?P<sy>\d{4})))"
+)
+# en/em dashes and non-breaking spaces normalised in a single translate() pass
+DATE_TEXT_TRANS = str.maketrans({"\u2013": "-", "\u2014": "-", "\u00a0": " "})
+MONTHS = {
+    name: i
+    for i, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1
+    )
+}
 EIGHT_DIGIT = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+ICS_FOLD = re.compile(r"(?:\r\n|\r|\n)[ \t]")
+ICS_FIELDS = frozenset({"SUMMARY", "DTSTART", "DTEND", "LOCATION", "URL"})
 EIGHT_TIME = re.compile(r"^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})(Z?)$")
+# JSON-LD blocks are found by walking <script> tags with linear scans; a single
+# "<script ...>(.*?)</script>" pattern backtracks quadratically on unclosed tags
+# [^<>] keeps a failed open-tag match from running past the next "<"
+SCRIPT_OPEN = re.compile(r"<script\b([^<>]*)>", re.IGNORECASE)
+SCRIPT_CLOSE = re.compile(r"</script\s*>", re.IGNORECASE)
+JSONLD_TYPE = re.compile(r"\btype\s*=\s*[\"']?application/ld\+json", re.IGNORECASE)
+# every @type accepted by extract_jsonld_events contains one of these words
+JSONLD_EVENT_HINT = re.compile(r"event|festival", re.IGNORECASE)
+MAX_JSONLD_CHARS = 2_000_000
+# Byte-level prefilter for fetched pages: JSON-LD, an .ics link, an ISO date or
+# a month name followed by a year (through whitespace, &nbsp; or inline tags).
+# Anything extract_events_from_page can turn into an event has one of these in
+# its body or URL. [^<>] keeps a failed tag match from running past the next "<".
+EVENT_HINT = re.compile(
+    rb"ld\+json|\.ics"
+    rb"|\d{4}(?:-|\xe2\x80[\x93\x94])\d{2}(?:-|\xe2\x80[\x93\x94])\d{2}"
+    rb"|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*"
+    rb"(?:\s|\xc2\xa0|&nbsp;|&#160;|<[^<>]*>)+\d{4}",
+    re.IGNORECASE,
+)
+# same result as <title\b[^<>]*>(.*?)</title (DOTALL), but page_title() looks for
+# the closing tag once, so many unclosed <title> tags cannot make it quadratic;
+# title text is RCDATA and may contain "<"
+TITLE_OPEN = re.compile(r"<title\b[^<>]*>", re.IGNORECASE)
+TITLE_CLOSE = re.compile(r"</title", re.IGNORECASE)
+ICS_HINT = re.compile(r"\.ics", re.IGNORECASE)
+# the title/date fallback only scans these page regions, not the raw HTML
+DATE_META_NAMES = ["description", "og:description"]
+DATE_TEXT_CHARS = 8000
 
 
 def parse_date_range_text(txt: str) -> Optional[Tuple[datetime, datetime]]:
-    t = (txt or "").replace("\u2013", "-").replace("\u2014", "-").replace("\u00a0", " ")
-    m = ISO.search(t)
-    if m:
-        y, mth, d = map(int, m.groups())
-        start = datetime(y, mth, d, 9, 0, 0, tzinfo=LONDON_TZ)
-        end = start + timedelta(hours=8)
-        return start, end
-    m = DATE_RANGE.search(t)
-    if m:
-        d1, d2, mon, y = int(m.group(1)), int(m.group(2)), m.group(3), int(m.group(4))
-        try:
-            mn = datetime.strptime(mon[:3], "%b").month
-        except ValueError:
-            mn = None
+    t = (txt or "").translate(DATE_TEXT_TRANS)
+    # an ISO date anywhere wins, then the first range, then the first single date
+    first_range = first_single = None
+    for m in DATE_ANY.finditer(t):
+        if m.group("iso"):
+            start = datetime(int(m["iy"]), int(m["im"]), int(m["id"]), 9, 0, 0, tzinfo=LONDON_TZ)
+            return start, start + timedelta(hours=8)
+        if m.group("range"):
+            first_range = first_range or m
+        elif first_single is None:
+            first_single = m
+    if first_range:
+        mn = MONTHS.get(first_range["rmon"][:3].lower())
         if mn:
+            y = int(first_range["ry"])
             return (
-                datetime(y, mn, d1, 9, 0, 0, tzinfo=LONDON_TZ),
-                datetime(y, mn, d2, 17, 0, 0, tzinfo=LONDON_TZ),
+                datetime(y, mn, int(first_range["rd1"]), 9, 0, 0, tzinfo=LONDON_TZ),
+                datetime(y, mn, int(first_range["rd2"]), 17, 0, 0, tzinfo=LONDON_TZ),
             )
-    m = DATE_SINGLE.search(t)
-    if m:
-        d, mon, y = int(m.group(1)), m.group(2), int(m.group(3))
-        try:
-            mn = datetime.strptime(mon[:3], "%b").month
-        except ValueError:
-            mn = None
+    if first_single:
+        mn = MONTHS.get(first_single["smon"][:3].lower())
         if mn:
-            start = datetime(y, mn, d, 9, 0, 0, tzinfo=LONDON_TZ)
-            end = start + timedelta(hours=8)
-            return start, end
+            start = datetime(int(first_single["sy"]), mn, int(first_single["sd"]), 9, 0, 0, tzinfo=LONDON_TZ)
+            return start, start + timedelta(hours=8)
     return None
 
 
+if sys.version_info >= (3, 11):  # pragma: no cover - runtime dependent
+    parse_iso = datetime.fromisoformat  # parses a trailing "Z" natively
+else:  # pragma: no cover
+    def parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def parse_possible_datetime(value) -> Optional[datetime]:
     if not value:
         return None
@@ -257,9 +566,7 @@ def parse_possible_datetime(value) -> Optional[datetime]:
     if not val:
         return None
     try:
-        if val.endswith("Z"):
-            return datetime.fromisoformat(val.replace("Z", "+00:00"))
-        parsed = datetime.fromisoformat(val)
+        parsed = parse_iso(val)
         if parsed.tzinfo is None:
             return parsed.replace(tzinfo=LONDON_TZ)
         return parsed
@@ -269,7 +576,7 @@ def parse_possible_datetime(value) -> Optional[datetime]:
     if m:
         y, mth, d, hh, mm, ss, z = m.groups()
         dt = datetime(int(y), int(mth), int(d), int(hh), int(mm), int(ss))
-        return dt.replace(tzinfo=timezone.utc if z else LONDON_TZ)
+        return dt.replace(tzinfo=UTC if z else LONDON_TZ)
     m = EIGHT_DIGIT.match(val)
     if m:
         y, mth, d = map(int, m.groups())
@@ -285,35 +592,76 @@ def ensure_list(value) -> List:
     return [value]
 
 
+@functools.lru_cache(maxsize=4096)  # the same titles recur across pages and cache replays
 def sector_for(title: str) -> Optional[str]:
     t = (title or "").lower()
-    for sector in SECTOR_DEFS:
-        keywords = sector.get("keywords") or []
-        if any(k in t for k in keywords):
-            return sector["name"]  # type: ignore[index]
+    if SECTOR_AUTOMATON is not None:  # pragma: no branch - runtime dependent
+        # single pass over the title; the earliest sector wins, as in the regex path
+        idx = min((i for _, i in SECTOR_AUTOMATON.iter(t)), default=None)
+        return SECTOR_DEFS[idx]["name"] if idx is not None else None  # type: ignore[return-value]
+    for name, pattern in SECTOR_PATTERNS:
+        if pattern.search(t):
+            return name  # type: ignore[return-value]
     return None
 
 
-def unify(title: str, start_iso: str, end_iso: str, venue: str, url: str) -> Dict[str, object]:
+def unify(title: str, start: datetime, end: datetime, venue: str, url: str) -> Dict[str, object]:
     clean_title = title.strip()
     sector = sector_for(clean_title)
     return {
         "title": clean_title,
-        "start": start_iso,
-        "end": end_iso,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
         "url": url,
         "venue": venue or "London",
         "sector": [sector] if sector else [],
         "exhibitors": [],
         "free": False,
+        # parsed bounds ride along so main() does not re-parse the ISO strings
+        "_start_dt": start,
+        "_end_dt": end,
     }
 
 
 # ---- structured-data extraction -----------------------------------------
 
-def extract_jsonld_events(html: str) -> List[Tuple[str, str, str, str, str]]:
-    soup = BeautifulSoup(html, "html.parser")
-    events: List[Tuple[str, str, str, str, str]] = []
+def jsonld_payloads(page: str | BeautifulSoup) -> List[str]:
+    """Return the raw JSON-LD blobs in ``page``.
+
+    Raw HTML is scanned tag by tag so no tree has to be built; an already
+    parsed tree is walked with BeautifulSoup.
+    """
+    payloads: List[str] = []
+    if not isinstance(page, BeautifulSoup):
+        pos = 0
+        while True:
+            opening = SCRIPT_OPEN.search(page, pos)
+            if not opening:
+                break
+            closing = SCRIPT_CLOSE.search(page, opening.end())
+            if not closing:
+                break
+            if JSONLD_TYPE.search(opening.group(1)):
+                payloads.append(page[opening.end():closing.start()])
+            pos = closing.end()
+        return payloads
+    for tag in page.find_all("script", type="application/ld+json"):
+        if tag.string or tag.contents:
+            payloads.append(str(tag.string or tag.contents[0]))
+    return payloads
+
+
+def extract_jsonld_events(page: str | BeautifulSoup | List[str],
+                          window: Optional[Tuple[datetime, datetime]] = None
+                          ) -> Tuple[List[Tuple[str, datetime, datetime, str, str]], int]:
+    """Return ``(events, found)`` for the JSON-LD events in ``page``.
+
+    ``found`` counts every event with a usable start date, including those
+    dropped for starting outside ``window``.
+    """
+    payloads = page if isinstance(page, list) else jsonld_payloads(page)
+    events: List[Tuple[str, datetime, datetime, str, str]] = []
+    found = 0
     seen = set()
 
     def iter_event_nodes(node, inherited=None):
@@ -345,16 +693,25 @@ def extract_jsonld_events(html: str) -> List[Tuple[str, str, str, str, str]]:
             for item in node:
                 yield from iter_event_nodes(item, inherited)
 
-    for tag in soup.find_all("script", type="application/ld+json"):
+    for payload in payloads:
+        # a cheap scan skips pathological blobs and graphs that cannot hold an event
+        if len(payload) > MAX_JSONLD_CHARS or not JSONLD_EVENT_HINT.search(payload):
+            continue
         try:
-            payload = tag.string or tag.contents[0]
-            data = json.loads(payload)
+            data = jloads(payload)
         except Exception:
             continue
         for event_obj in iter_event_nodes(data):
             if not isinstance(event_obj, dict):
                 continue
-            identifier = json.dumps(event_obj, sort_keys=True, ensure_ascii=False)
+            # the fields that identify an event are enough for dedup; serialising the
+            # whole (possibly deeply nested) node just to hash it is wasted work
+            identifier = (
+                str(event_obj.get("name") or ""),
+                str(event_obj.get("startDate") or event_obj.get("startTime") or ""),
+                str(event_obj.get("endDate") or event_obj.get("endTime") or ""),
+                str(event_obj.get("url") or event_obj.get("@id") or ""),
+            )
             if identifier in seen:
                 continue
             seen.add(identifier)
@@ -367,6 +724,9 @@ def extract_jsonld_events(html: str) -> List[Tuple[str, str, str, str, str]]:
             start_dt = parse_possible_datetime(start_raw)
             if not start_dt:
                 continue
+            found += 1
+            if window and not window[0] <= start_dt <= window[1]:
+                continue
             end_dt = parse_possible_datetime(end_raw) or (start_dt + timedelta(hours=8))
             if end_dt < start_dt:
                 end_dt = start_dt + timedelta(hours=8)
@@ -390,9 +750,9 @@ def extract_jsonld_events(html: str) -> List[Tuple[str, str, str, str, str]]:
                 or event_obj.get("@id")
                 or ""
             )
-            events.append((name, start_dt.isoformat(), end_dt.isoformat(), venue, url))
+            events.append((name, start_dt, end_dt, venue, url))
 
-    return events
+    return events, found
 
 
 def find_ics_links(soup: BeautifulSoup, base_url: str) -> Iterable[str]:
@@ -408,16 +768,28 @@ def find_ics_links(soup: BeautifulSoup, base_url: str) -> Iterable[str]:
                 yield full
 
 
+@functools.lru_cache(maxsize=64)
+def zone_for(tzid: str):
+    """Return the zone for an ICS ``TZID``, or ``None`` if it is unknown.
+
+    Feeds repeat the same TZID on every DTSTART/DTEND, so each name (including
+    unknown ones, which cost a tz database lookup) is resolved only once.
+    """
+    if ZoneInfo is None:  # pragma: no cover
+        return None
+    try:
+        return ZoneInfo(tzid)
+    except Exception:  # pragma: no cover - depends on tz database
+        return None
+
+
 def parse_ics_datetime(value: Optional[str], tz_hint: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     value = value.strip()
-    tz = timezone.utc if value.endswith("Z") else None
-    if tz_hint and not tz and ZoneInfo is not None:
-        try:
-            tz = ZoneInfo(tz_hint)
-        except Exception:  # pragma: no cover - depends on tz database
-            tz = None
+    tz = UTC if value.endswith("Z") else None
+    if tz_hint and not tz:
+        tz = zone_for(tz_hint)
     tz = tz or LONDON_TZ
     clean = value.rstrip("Z")
     if len(clean) == 8 and clean.isdigit():
@@ -430,92 +802,135 @@ def parse_ics_datetime(value: Optional[str], tz_hint: Optional[str]) -> Optional
         return parse_possible_datetime(value)
 
 
-def parse_ics_events(data: str, source_url: str) -> List[Dict[str, object]]:
-    lines: List[str] = []
-    for raw in data.splitlines():
-        raw = raw.rstrip("\r\n")
-        if not raw:
-            continue
-        if raw.startswith(" ") and lines:
-            lines[-1] += raw[1:]
-        else:
-            lines.append(raw)
+def parse_ics_events(data: str, source_url: str,
+                     window: Optional[Tuple[datetime, datetime]] = None) -> Tuple[List[Dict[str, object]], int]:
+    """Return ``(events, found)`` for the VEVENTs in ``data``.
 
+    ``found`` counts every VEVENT with a usable start, including those
+    dropped for starting outside ``window``.
+    """
     events: List[Dict[str, object]] = []
-    current: Dict[str, str] = {}
-    for line in lines:
+    found = 0
+    current: Optional[Dict[str, str]] = None
+    # unfold continuation lines in one pass, then only look at the VEVENT
+    # properties we actually use
+    for line in ICS_FOLD.sub("", data).splitlines():
         if line == "BEGIN:VEVENT":
             current = {}
             continue
         if line == "END:VEVENT":
-            if current.get("SUMMARY") and current.get("DTSTART"):
+            if current and current.get("SUMMARY") and current.get("DTSTART"):
                 start = parse_ics_datetime(current.get("DTSTART"), current.get("DTSTART_TZID"))
                 end = parse_ics_datetime(current.get("DTEND"), current.get("DTEND_TZID"))
-                if not start:
-                    current = {}
+                if start:
+                    found += 1
+                if not start or (window and not window[0] <= start <= window[1]):
+                    current = None
                     continue
                 if not end or end < start:
                     end = start + timedelta(hours=8)
                 events.append(
                     unify(
                         current.get("SUMMARY", "Untitled event"),
-                        start.isoformat(),
-                        end.isoformat(),
+                        start,
+                        end,
                         current.get("LOCATION", "London"),
                         current.get("URL") or source_url,
                     )
                 )
-            current = {}
+            current = None
             continue
-        if ":" not in line:
+        if current is None:
             continue
-        key, value = line.split(":", 1)
-        base_key = key.split(";", 1)[0].upper()
-        params = key[len(base_key):]
-        if params.startswith(";"):
-            params = params[1:]
-        else:
-            params = ""
-        param_map = {}
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        base_key, _, params = key.partition(";")
+        base_key = base_key.upper()
+        if base_key not in ICS_FIELDS:
+            continue
+        current[base_key] = value.strip()
         if params:
             for segment in params.split(";"):
-                if "=" in segment:
-                    pk, pv = segment.split("=", 1)
-                    param_map[pk.upper()] = pv
-        current[base_key] = value.strip()
-        for pk, pv in param_map.items():
-            current[f"{base_key}_{pk}"] = pv
-    return events
-
-
-def extract_events_from_page(url: str, html: str) -> List[Dict[str, object]]:
-    jsonld_events = extract_jsonld_events(html)
-    if jsonld_events:
+                pk, eq, pv = segment.partition("=")
+                if eq and pk.upper() == "TZID":
+                    current[f"{base_key}_TZID"] = pv
+    return events, found
+
+
+def page_title(html: str, url: str) -> str:
+    opening = TITLE_OPEN.search(html)
+    closing = TITLE_CLOSE.search(html, opening.end()) if opening else None
+    title = unescape(html[opening.end():closing.start()]) if closing else None
+    return (title or url).strip()
+
+
+def date_text(soup: BeautifulSoup) -> str:
+    """Collect the parts of a page likely to carry its event dates.
+
+    Title, meta descriptions, ``<time>`` elements and the start of the visible
+    text are a small fraction of the raw HTML and leave out script/style bodies.
+    """
+    parts = [soup.title.string if soup.title else None]
+    for meta in soup.find_all("meta", attrs={"name": DATE_META_NAMES}):
+        parts.append(meta.get("content"))
+    for meta in soup.find_all("meta", attrs={"property": DATE_META_NAMES}):
+        parts.append(meta.get("content"))
+    for tag in soup.find_all("time"):
+        parts.append(tag.get("datetime"))
+    parts.append(soup.get_text(" ", strip=True)[:DATE_TEXT_CHARS])
+    return " | ".join(str(p) for p in parts if p)
+
+
+def extract_events_from_page(url: str, html: str,
+                             window: Optional[Tuple[datetime, datetime]] = None) -> List[Dict[str, object]]:
+    """Return the events found on ``url``.
+
+    With ``window``, structured events starting outside it are dropped before
+    any further extraction work is done on them. A page whose JSON-LD or ICS
+    events were all dropped yields nothing; the title/date fallback is only
+    for pages without structured events.
+    """
+    # JSON-LD usually comes straight out of the regex fast path; the tree is
+    # only built (once) when that misses or the ICS/title fallbacks need it
+    soup = None
+    payloads = jsonld_payloads(html)
+    if not payloads:
+        soup = BeautifulSoup(html, HTML_PARSER)
+        payloads = jsonld_payloads(soup)
+    jsonld_events, found = extract_jsonld_events(payloads, window)
+    if found:
         results: List[Dict[str, object]] = []
         for name, start, end, venue, link in jsonld_events:
             page_link = link or url
             results.append(unify(name, start, end, venue, page_link))
         return results
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
     collected: List[Dict[str, object]] = []
-    for link in find_ics_links(soup, url):
+    ics_found = 0
+    # walking every <a>/<link> is only worth it if an .ics href can be there
+    ics_links = find_ics_links(soup, url) if ICS_HINT.search(html) else ()
+    for link in ics_links:
         try:
-            ics_text = http_get(link, headers=HEADERS, timeout=30)
+            ics_text = http_get(link, headers=HEADERS, timeout=PAGE_TIMEOUT, max_bytes=MAX_PAGE_BYTES)
         except Exception:
             continue
         if isinstance(ics_text, bytes):
             ics_text = ics_text.decode("utf-8", errors="replace")
-        collected.extend(parse_ics_events(ics_text, url))
-    if collected:
+        ics_events, found = parse_ics_events(ics_text, url, window)
+        collected.extend(ics_events)
+        ics_found += found
+    if ics_found:
         return collected
 
-    name = (soup.title.string if soup.title else url).strip()
-    dr = parse_date_range_text(html) or parse_date_range_text(name)
+    name = page_title(html, url)
+    dr = parse_date_range_text(date_text(soup)) or parse_date_range_text(name)
     if not dr:
         return []
     start, end = dr
-    return [unify(name, start.isoformat(), end.isoformat(), "London", url)]
+    return [unify(name, start, end, "London", url)]
 
 
 # ---- manual seeds -------------------------------------------------------
@@ -544,8 +959,8 @@ def load_manual_events() -> List[Dict[str, object]]:
         manual.append(
             unify(
                 title,
-                start.isoformat(),
-                end.isoformat(),
+                start,
+                end,
                 entry.get("venue", "London"),
                 entry.get("url", ""),
             )
@@ -555,9 +970,75 @@ def load_manual_events() -> List[Dict[str, object]]:
 
 # ---- main workflow ------------------------------------------------------
 
-def within_window(dt: datetime) -> bool:
-    now = datetime.now(timezone.utc)
-    return now <= dt <= now + timedelta(days=WINDOW_DAYS)
+def is_cached_event(event: object) -> bool:
+    """Return whether a replayed cache entry has the fields ``main()`` relies on."""
+    return isinstance(event, dict) and all(isinstance(event.get(k), str) for k in ("title", "start", "end"))
+
+
+def page_events(url: str, cache: Dict[str, Dict[str, object]], window: Tuple[datetime, datetime],
+                now: datetime, negative: Dict[str, str]) -> List[Dict[str, object]]:
+    """Fetch ``url`` and return its events, replaying the cached ones on HTTP 304.
+
+    A page that was fetched but yields no events is recorded in ``negative``.
+    Fetch and extraction failures are not, so they are retried next run.
+    """
+    page = fetch_page(url, cache)
+    if page is None:
+        return []
+    if page is NOT_MODIFIED:
+        # the cache file is hand-deletable state, so only well-formed events are replayed
+        cached = cache[url].get("events")
+        events = [e for e in cached if is_cached_event(e)] if isinstance(cached, list) else []
+        if not cached:  # a malformed entry is not evidence of a non-event page
+            negative[url] = (now + timedelta(days=NEGATIVE_TTL_DAYS)).isoformat()
+        return events
+    body, charset = page
+    try:
+        # pages with nothing the extractors could use are neither decoded nor parsed;
+        # the URL is checked too, as the title fallback reads it when a page has no <title>
+        if EVENT_HINT.search(body) or EVENT_HINT.search(url.encode("utf-8")):
+            events = extract_events_from_page(url, decode_body(body, charset), window)
+        else:
+            events = []
+    except Exception as ex:  # pragma: no cover - one odd page must not sink the run
+        print(f"[warn] extraction failed: {url} :: {ex}")
+        return []
+    if url in cache:
+        cache[url]["events"] = [persistable(e) for e in events]
+        cache[url]["extracted"] = now.isoformat()
+    if not events:
+        negative[url] = (now + timedelta(days=NEGATIVE_TTL_DAYS)).isoformat()
+    return events
+
+
+def event_datetimes(event: Dict[str, object]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Return the start/end datetimes, reusing the ones ``unify`` cached on the event.
+
+    Events replayed from the HTTP cache only carry ISO strings and are parsed here.
+    """
+    s_dt = event.get("_start_dt")
+    if s_dt is None:
+        try:
+            s_dt = parse_iso(str(event["start"]))
+        except Exception:
+            s_dt = parse_possible_datetime(event["start"])
+        if not s_dt:
+            return None, None
+    e_dt = event.get("_end_dt")
+    if e_dt is None:
+        try:
+            e_dt = parse_iso(str(event["end"]))
+        except Exception:
+            e_dt = parse_possible_datetime(event["end"]) or (s_dt + timedelta(hours=8))
+    return s_dt, e_dt  # type: ignore[return-value]
+
+
+def event_key(event: Dict[str, object]) -> Tuple[str, str]:
+    """Return the (title, venue) dedup key, computed once and cached on ``event``."""
+    key = event.get("_key")
+    if key is None:
+        key = event["_key"] = (str(event["title"]).lower().strip(), event["venue"])
+    return key  # type: ignore[return-value]
 
 
 def main() -> None:
@@ -565,99 +1046,102 @@ def main() -> None:
         print("Missing GOOGLE_API_KEY or GOOGLE_CX")
         return
 
-    queries = [f"{BASE_QUERY} {q}" for q in SECTOR_QUERIES] + [
-        f'{BASE_QUERY} "ExCeL London"',
-        f'{BASE_QUERY} "Olympia London"',
-        f'{BASE_QUERY} "Business Design Centre"',
-        f'{BASE_QUERY} "QEII Centre"',
-        f'{BASE_QUERY} "Tobacco Dock"',
-        f'{BASE_QUERY} "Design Centre Chelsea Harbour"',
-        f'{BASE_QUERY} "The O2"',
-        f'{BASE_QUERY} site:excel.london',
-        f'{BASE_QUERY} site:olympia.london',
-    ]
+    now = datetime.now(UTC)
+    window_end = now + timedelta(days=WINDOW_DAYS)
+    horizon = now + timedelta(days=HORIZON_DAYS)
 
+    def run_search(q: str) -> List[str]:
+        SEARCH_BUCKET.take()
+        return google_search(q, RESULTS_PER_QUERY)
+
+    # results are consumed in submission order so the output stays deterministic
     urls: List[str] = []
-    for q in queries:
-        try:
-            urls += google_search(q, RESULTS_PER_QUERY)
-            time.sleep(0.25)
-        except Exception as ex:
-            print(f"[warn] search failed: {q} :: {ex}")
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+        searches = [pool.submit(run_search, q) for q in ALL_QUERIES]
+        for q, fut in zip(ALL_QUERIES, searches):
+            try:
+                urls += fut.result()
+            except Exception as ex:
+                print(f"[warn] search failed: {q} :: {ex}")
     urls = list(dict.fromkeys(urls))  # dedupe
 
+    # pages answered with 304 reuse the events extracted when they last changed;
+    # extractions older than CACHE_MAX_AGE_DAYS are dropped so those pages are refetched
+    stale = (now - timedelta(days=CACHE_MAX_AGE_DAYS)).isoformat()
+    # malformed entries are dropped like expired ones rather than aborting the run
+    http_cache = {
+        str(u): e for u, e in load_cache(HTTP_CACHE).items()
+        if isinstance(e, dict) and str(e.get("extracted", "")) >= stale
+    }
+    # known non-event pages are skipped until their entry expires
+    negative = {
+        str(u): exp for u, exp in load_cache(NEGATIVE_URLS).items()
+        if isinstance(exp, str) and exp > now.isoformat()
+    }
+    fetch_urls = [u for u in urls if u not in negative]
+    extract_window = (now, window_end + timedelta(days=CACHE_MAX_AGE_DAYS))
     candidates: List[Dict[str, object]] = []
-    for url in urls:
-        try:
-            html = http_get(url, headers=HEADERS, timeout=30)
-        except Exception:
-            continue
-        if isinstance(html, bytes):
-            html = html.decode("utf-8", errors="replace")
-        for event in extract_events_from_page(url, html):
-            try:
-                s_dt = datetime.fromisoformat(str(event["start"]).replace("Z", "+00:00"))
-            except Exception:
-                s_dt = parse_possible_datetime(event["start"])
-            if not s_dt or not within_window(s_dt):
-                continue
-            try:
-                e_dt = datetime.fromisoformat(str(event["end"]).replace("Z", "+00:00"))
-            except Exception:
-                e_dt = parse_possible_datetime(event["end"]) or (s_dt + timedelta(hours=8))
-            candidates.append(
-                unify(
-                    event["title"],
-                    s_dt.isoformat(),
-                    e_dt.isoformat(),
-                    event.get("venue", "London"),
-                    event.get("url", url) or url,
-                )
-            )
+    # workers fetch *and* extract, so parsing overlaps with other downloads;
+    # results are consumed in order to keep the output deterministic
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        pages = pool.map(lambda u: page_events(u, http_cache, extract_window, now, negative), fetch_urls)
+        for url, events in zip(fetch_urls, pages):
+            for event in events:
+                s_dt, e_dt = event_datetimes(event)
+                if not s_dt or not now <= s_dt <= window_end:
+                    continue
+                if "_start_dt" not in event:
+                    # replayed from the HTTP cache: rebuild so the current sector rules apply
+                    event = unify(event["title"], s_dt, e_dt, event.get("venue", "London"), event.get("url", ""))
+                # freshly extracted events already went through unify(); reuse them as-is
+                event["url"] = event.get("url") or url
+                candidates.append(event)
 
-    existing = load_events()
-    bykey = {(e["title"].lower().strip(), e["venue"]): e for e in existing}
+    # the store is keyed by event_key so lookups and replacements are O(1);
+    # dict order keeps events.json in its existing order with new events last
+    store = {event_key(e): e for e in load_events()}
 
     # ensure manual seeds are always present without being counted as "added"
     for seed in load_manual_events():
-        key = (seed["title"].lower().strip(), seed["venue"])
-        if key not in bykey:
-            existing.append(seed)
-            bykey[key] = seed
+        store.setdefault(event_key(seed), seed)
 
     added: List[Dict[str, object]] = []
     changed: List[Dict[str, object]] = []
     for ne in candidates:
-        key = (ne["title"].lower().strip(), ne["venue"])
-        if key in bykey:
-            ex = bykey[key]
+        key = event_key(ne)
+        ex = store.get(key)
+        if ex is not None:
             if ex["start"][:10] != ne["start"][:10] or ex["end"][:10] != ne["end"][:10]:
                 ne["sector"] = ex.get("sector", []) or ne.get("sector", [])
                 ne["exhibitors"] = ex.get("exhibitors", [])
                 ne["free"] = ex.get("free", False)
-                existing[existing.index(ex)] = ne
-                bykey[key] = ne
+                store[key] = ne
                 changed.append(ne)
             else:
                 if not ex.get("url"):
                     ex["url"] = ne["url"]
         else:
-            existing.append(ne)
-            bykey[key] = ne
+            store[key] = ne
             added.append(ne)
 
-    horizon = datetime.now(timezone.utc) + timedelta(days=190)
     cleaned: List[Dict[str, object]] = []
-    for event in existing:
+    for event in store.values():
         try:
-            dt = datetime.fromisoformat(str(event["start"]).replace("Z", "+00:00"))
+            dt = event.get("_start_dt") or parse_iso(str(event["start"]))
             if dt <= horizon:
                 cleaned.append(event)
         except Exception:
             cleaned.append(event)
 
-    save_events(cleaned)
-    write_changelog(added, changed)
+    # events.json is the source of truth and is written synchronously; the
+    # changelog is a side artefact and goes through the background writer
+    with AsyncWriter() as writer:
+        write_changelog(writer, added, changed, now)
+        # only pages seen this run are kept so the cache cannot grow without bound
+        kept = {u: http_cache[u] for u in urls if "events" in http_cache.get(u, {})}
+        writer.write(HTTP_CACHE, jdumps(kept, as_bytes=True))
+        writer.write(NEGATIVE_URLS, jdumps(negative, sort_keys=True, as_bytes=True))
+        save_events(cleaned)
     print(
         f"Google candidates: {len(candidates)}, added: {len(added)}, changed: {len(changed)}, total: {len(cleaned)}"
     )